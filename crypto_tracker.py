@@ -1,17 +1,28 @@
-import requests
-import tkinter as tk
-from tkinter import messagebox
-import threading
+import asyncio
+import csv
+import json
+import math
+import os
 import time
-from collections import deque
+import aiohttp
+import tkinter as tk
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # ================= CONFIGURATION =================
 
 REFRESH_INTERVAL = 2  # seconds
+UI_POLL_INTERVAL = 0.01  # seconds between Tk event processing passes
 MAX_POINTS = 60       # points on graph
+STATUS_DISPLAY_TIME = 4  # seconds a message stays in the status bar
+HISTORY_LOG = None    # CSV file to append every price update to, e.g. "prices.csv"
 
 COINS = {
     "Bitcoin": "BTCUSDT",
@@ -28,15 +39,36 @@ ALERTS = {
 # =================================================
 
 
-def fetch_price(symbol):
-    """Fetch price from Binance API"""
+async def fetch_prices(session, symbols):
+    """Fetch prices for several symbols from Binance API in one request"""
     url = "https://api.binance.com/api/v3/ticker/price"
-    params = {"symbol": symbol}
-    headers = {"User-Agent": "Mozilla/5.0"}
+    params = {"symbols": json.dumps(list(symbols), separators=(",", ":"))}
+    timeout = aiohttp.ClientTimeout(total=10)
+
+    async with session.get(url, params=params, timeout=timeout) as response:
+        response.raise_for_status()
+        data = json_loads(await response.read())
+    return {item["symbol"]: float(item["price"]) for item in data}
+
+
+class PriceHistory:
+    """Fixed-size ring buffer holding the most recent prices"""
+
+    def __init__(self, size):
+        self.buffer = np.empty(size, dtype=np.float64)
+        self.head = 0
+        self.count = 0
 
-    response = requests.get(url, params=params, headers=headers, timeout=10)
-    response.raise_for_status()
-    return float(response.json()["price"])
+    def append(self, price):
+        self.buffer[self.head] = price
+        self.head = (self.head + 1) % len(self.buffer)
+        self.count = min(self.count + 1, len(self.buffer))
+
+    def values(self):
+        """Return the stored prices, oldest first"""
+        if self.count < len(self.buffer):
+            return self.buffer[:self.count]
+        return np.concatenate((self.buffer[self.head:], self.buffer[:self.head]))
 
 
 class CryptoTrackerApp:
@@ -46,19 +78,46 @@ class CryptoTrackerApp:
         self.root.geometry("900x700")
 
         self.price_history = {
-            coin: deque(maxlen=MAX_POINTS) for coin in COINS
+            coin: PriceHistory(MAX_POINTS) for coin in COINS
         }
 
+        # Alert thresholds indexed like COINS; NaN means no alert is set
+        self.coin_index = {coin: i for i, coin in enumerate(COINS)}
+        self.alert_thresholds = np.array(
+            [np.nan if ALERTS[coin] is None else ALERTS[coin] for coin in COINS],
+            dtype=np.float64
+        )
+
         self.price_labels = {}
+        self.last_labels = {coin: None for coin in COINS}
         self.alert_entries = {}
-
+        self.clear_status_job = None
+        self.running = True
+
+        # Blitting state: one cached line per coin, redrawn over its axes' saved background
+        self.lines = {}
+        self.axis_limits = {coin: None for coin in COINS}
+        self.backgrounds = {}
+        # Coins with prices not yet pushed to their line
+        self.dirty = {coin: False for coin in COINS}
+
+        self.log_file = None
+        self.log_writer = None
+        if HISTORY_LOG:
+            self.open_history_log(HISTORY_LOG)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.build_ui()
-        self.start_updating()
 
     def build_ui(self):
         title = tk.Label(self.root, text="LIVE CRYPTO TRACKER", font=("Arial", 18, "bold"))
         title.pack(pady=10)
 
+        # Non-modal messages: a modal dialog would also block price updates,
+        # which share the Tk thread
+        self.status_label = tk.Label(self.root, text="", font=("Arial", 12, "bold"), fg="red")
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
+
         self.main_frame = tk.Frame(self.root)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -89,74 +148,170 @@ class CryptoTrackerApp:
         right = tk.Frame(self.main_frame)
         right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        self.fig, self.axes = plt.subplots(len(COINS), 1, figsize=(6, 6))
-        if len(COINS) == 1:
-            self.axes = [self.axes]
+        self.fig = Figure(figsize=(6, 6))
+        self.axes = self.fig.subplots(len(COINS), 1, sharex=True, squeeze=False)[:, 0]
 
         for ax, coin in zip(self.axes, COINS):
             ax.set_title(f"{coin} Price (USD)")
             ax.set_ylabel("USD")
+            ax.set_xlim(0, MAX_POINTS - 1)
+            (self.lines[coin],) = ax.plot([], [], linewidth=1.5, animated=True)
 
         for ax in self.axes:
             ax.grid(True, linestyle="--", alpha=0.3)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=right)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def on_draw(self, event):
+        # Every full redraw (first show, resize, new axis limits) refreshes
+        # the per-axes backgrounds that later ticks restore before blitting
+        for ax, coin in zip(self.axes, COINS):
+            self.backgrounds[coin] = self.canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(self.lines[coin])
+
+    def open_history_log(self, path):
+        # Append-only and line-buffered: each tick costs one row and a crash
+        # loses at most the row being written
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.log_file = open(path, "a", newline="", buffering=1)
+        self.log_writer = csv.writer(self.log_file)
+        if is_new:
+            self.log_writer.writerow(["Time", *COINS])
 
     def set_alert(self, coin):
         value = self.alert_entries[coin].get()
         try:
-            ALERTS[coin] = float(value)
-            messagebox.showinfo("Alert Set", f"{coin} alert set at ${value}")
+            threshold = float(value)
+            # NaN marks "no alert" and inf can never fire, so neither is a usable threshold
+            if not math.isfinite(threshold):
+                raise ValueError(value)
         except ValueError:
-            messagebox.showerror("Invalid Input", "Enter a valid number")
+            self.show_status("Invalid input: enter a valid number")
+        else:
+            self.alert_thresholds[self.coin_index[coin]] = threshold
+            self.show_status(f"{coin} alert set at ${value}")
 
-    def start_updating(self):
-        threading.Thread(target=self.update_loop, daemon=True).start()
+    def close(self):
+        self.running = False
 
-    def update_loop(self):
-        while True:
-            for coin, symbol in COINS.items():
+    async def run(self):
+        """Run the Tk event loop and price updates together on one thread"""
+        updater = asyncio.create_task(self.update_loop())
+        try:
+            while self.running and not updater.done():
+                self.root.update()
+                await asyncio.sleep(UI_POLL_INTERVAL)
+            if updater.done():
+                # Re-raise a crash in the update loop rather than freezing on stale prices
+                updater.result()
+        finally:
+            updater.cancel()
+            await asyncio.gather(updater, return_exceptions=True)
+            if self.log_file:
+                self.log_file.close()
+            self.root.destroy()
+
+    async def update_loop(self):
+        # One session for the app's lifetime so the connection is kept alive
+        headers = {"User-Agent": "Mozilla/5.0"}
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300)
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            while self.running:
                 try:
-                    price = fetch_price(symbol)
-                    self.price_history[coin].append(price)
+                    prices = await fetch_prices(session, COINS.values())
+                except Exception as e:
+                    print("Error:", e)
+                    prices = {}
 
-                    self.root.after(
-                        0,
-                        lambda c=coin, p=price: self.price_labels[c].config(
-                            text=f"${p:,.2f}"
-                        )
+                if prices and self.log_writer:
+                    self.log_writer.writerow(
+                        [time.strftime("%Y-%m-%d %H:%M:%S")]
+                        + [prices.get(symbol, "") for symbol in COINS.values()]
                     )
 
-                    if ALERTS[coin] and price >= ALERTS[coin]:
-                        self.root.after(
-                            0,
-                            lambda c=coin: messagebox.showinfo(
-                                "Price Alert",
-                                f"{c} reached alert price!"
-                            )
-                        )
-                        ALERTS[coin] = None
-
-                except Exception as e:
-                    print("Error:", e)
+                for coin, symbol in COINS.items():
+                    price = prices.get(symbol)
+                    if price is None:
+                        continue
 
-            self.root.after(0, self.update_graphs)
-            time.sleep(REFRESH_INTERVAL)
+                    self.price_history[coin].append(price)
+                    self.dirty[coin] = True
+
+                    # Skip reconfiguring the label when the displayed text is unchanged
+                    text = f"${price:,.2f}"
+                    if text != self.last_labels[coin]:
+                        self.last_labels[coin] = text
+                        self.price_labels[coin].config(text=text)
+
+                # Missing prices and unset thresholds are NaN, which never compare true
+                current = np.array(
+                    [prices.get(symbol, np.nan) for symbol in COINS.values()],
+                    dtype=np.float64
+                )
+                fired = np.flatnonzero(current >= self.alert_thresholds)
+                if fired.size:
+                    self.alert_thresholds[fired] = np.nan
+                    names = list(COINS)
+                    triggered = ", ".join(names[i] for i in fired)
+                    self.show_status(f"{triggered} reached alert price!")
+                    self.root.bell()
+
+                self.update_graphs()
+                await asyncio.sleep(REFRESH_INTERVAL)
+
+    def show_status(self, message):
+        self.status_label.config(text=message)
+
+        # A newer message restarts the timer instead of being cleared early
+        if self.clear_status_job is not None:
+            self.root.after_cancel(self.clear_status_job)
+        self.clear_status_job = self.root.after(
+            STATUS_DISPLAY_TIME * 1000, self.clear_status
+        )
+
+    def clear_status(self):
+        self.status_label.config(text="")
+        self.clear_status_job = None
 
     def update_graphs(self):
-        for ax, coin in zip(self.axes, COINS):
-            ax.plot(self.price_history[coin])
-            ax.set_title(f"{coin} Price (USD)")
-            ax.set_ylabel("USD")
-
-        self.canvas.draw()
+        # Nothing is visible while minimized; dirty lines catch up once restored
+        if self.root.state() == "iconic":
+            return
+
+        dirty = [(ax, coin) for ax, coin in zip(self.axes, COINS) if self.dirty[coin]]
+        if not dirty:
+            return
+
+        limits_changed = False
+        for ax, coin in dirty:
+            self.dirty[coin] = False
+            history = self.price_history[coin].values()
+            self.lines[coin].set_data(np.arange(len(history)), history)
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+
+            limits = ax.get_ylim()
+            if limits != self.axis_limits[coin]:
+                self.axis_limits[coin] = limits
+                limits_changed = True
+
+        # Only re-render ticks and labels when the axes actually moved; the
+        # lines are repainted by on_draw once the idle redraw runs
+        if limits_changed or not self.backgrounds:
+            self.canvas.draw_idle()
+        else:
+            for ax, coin in dirty:
+                self.canvas.restore_region(self.backgrounds[coin])
+                ax.draw_artist(self.lines[coin])
+                self.canvas.blit(ax.bbox)
 
 
 def main():
     root = tk.Tk()
     app = CryptoTrackerApp(root)
-    root.mainloop()
+    asyncio.run(app.run())
 
 
 if __name__ == "__main__":